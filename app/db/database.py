@@ -1,6 +1,6 @@
 """Database connection and session management."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.config import settings
@@ -12,6 +12,21 @@ engine = create_engine(
     pool_pre_ping=True,
 )
 
+if engine.dialect.name == "sqlite":
+    # Tune local SQLite for the write-heavy seed path: WAL avoids
+    # rewriting the journal per commit, synchronous=NORMAL drops the
+    # per-commit fsync (safe with WAL short of power loss), and the
+    # temp-store/cache pragmas keep sorts and hot pages in memory.
+    # Applied per connection; Azure SQL is unaffected.
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.close()
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
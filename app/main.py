@@ -4,6 +4,7 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse
@@ -105,6 +106,27 @@ async def lifespan(app: FastAPI):
                         logger.info("Column 'role' added to users")
                     except Exception as e:
                         logger.debug(f"Column 'role' add failed (may already exist): {e}")
+
+                    # Add match_schedule updated_at column (used for ETag computation)
+                    try:
+                        logger.info("Attempting to add column 'updated_at' to match_schedule...")
+                        connection.execute(text("ALTER TABLE dbo.match_schedule ADD updated_at DATETIME NULL"))
+                        logger.info("Column 'updated_at' added to match_schedule")
+                    except Exception as e:
+                        logger.debug(f"Column 'updated_at' add failed (may already exist): {e}")
+
+                    # Unique key the seeding and the players 409 contract rely
+                    # on; filtered to match SQLite's distinct-NULL semantics
+                    try:
+                        logger.info("Attempting to create unique index uq_players_team_name_surname...")
+                        connection.execute(text(
+                            "CREATE UNIQUE INDEX uq_players_team_name_surname "
+                            "ON dbo.players (team_id, name, surname) "
+                            "WHERE team_id IS NOT NULL AND surname IS NOT NULL"
+                        ))
+                        logger.info("Unique index uq_players_team_name_surname created")
+                    except Exception as e:
+                        logger.debug(f"Unique index create failed (may already exist): {e}")
                 
             elif is_sqlite:
                 logger.info("Running SQLite schema migrations...")
@@ -129,6 +151,19 @@ async def lifespan(app: FastAPI):
                                 logger.info(f"Column '{col_name}' added successfully")
                             except Exception as e:
                                 logger.warning(f"Failed to add column '{col_name}': {e}")
+
+                    # Unique key the seeding upsert relies on; create_all only
+                    # adds it to fresh databases, so ensure it here for
+                    # pre-existing ones (fails harmlessly if duplicates exist)
+                    try:
+                        connection.execute(text(
+                            "CREATE UNIQUE INDEX IF NOT EXISTS uq_players_team_name_surname "
+                            "ON players (team_id, name, surname) "
+                            "WHERE team_id IS NOT NULL AND surname IS NOT NULL"
+                        ))
+                        logger.info("Unique index uq_players_team_name_surname ensured on players")
+                    except Exception as e:
+                        logger.warning(f"Failed to create unique index on players: {e}")
                     
                     # Add team user_id column
                     cursor = connection.execute(text("PRAGMA table_info(teams)"))
@@ -151,6 +186,17 @@ async def lifespan(app: FastAPI):
                             logger.info("Column 'role' added to users")
                         except Exception as e:
                             logger.warning(f"Failed to add column 'role': {e}")
+
+                    # Add match_schedule updated_at column (used for ETag computation)
+                    cursor = connection.execute(text("PRAGMA table_info(match_schedule)"))
+                    schedule_columns = {row[1] for row in cursor.fetchall()}
+                    if "updated_at" not in schedule_columns:
+                        try:
+                            logger.info("Adding column 'updated_at' to SQLite match_schedule...")
+                            connection.execute(text("ALTER TABLE match_schedule ADD COLUMN updated_at DATETIME NULL"))
+                            logger.info("Column 'updated_at' added to match_schedule")
+                        except Exception as e:
+                            logger.warning(f"Failed to add column 'updated_at': {e}")
             
             logger.info("Schema migrations completed")
         except Exception as e:
@@ -291,6 +337,9 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Compress large responses; repeated JSON keys in list payloads compress 5-10x
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
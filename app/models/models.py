@@ -1,7 +1,7 @@
 """SQLAlchemy models for the Football Performance Dashboard."""
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.hybrid import hybrid_property
 
@@ -52,6 +52,20 @@ class Player(Base):
     """Player model representing a football athlete."""
 
     __tablename__ = "players"
+    __table_args__ = (
+        # Lets seeding use conflict-ignoring inserts instead of
+        # SELECT-then-INSERT per player. Filtered so rows without a team
+        # or surname stay exempt: SQLite treats NULLs as distinct in a
+        # plain unique index but SQL Server treats them as equal, and the
+        # filter gives both backends the SQLite behaviour.
+        Index(
+            "uq_players_team_name_surname",
+            "team_id", "name", "surname",
+            unique=True,
+            sqlite_where=text("team_id IS NOT NULL AND surname IS NOT NULL"),
+            mssql_where=text("team_id IS NOT NULL AND surname IS NOT NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
@@ -132,3 +146,4 @@ class MatchSchedule(Base):
     notes = Column(Text, nullable=True)
     is_important = Column(Boolean, default=False)
     created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
@@ -9,7 +10,9 @@ from app.db.database import get_db
 from app.models.models import Player, TrainingSession, SessionStats, User, Team
 from app.utils.auth import get_current_user
 
-router = APIRouter(prefix="/analytics", tags=["analytics"])
+# orjson serializes these large nested dict payloads in C, several times
+# faster than the default json-based response class
+router = APIRouter(prefix="/analytics", tags=["analytics"], default_response_class=ORJSONResponse)
 
 
 @router.get("/training-load")
@@ -386,8 +389,8 @@ def get_ml_injury_predictions(
     
     if not db_players:
         # Fallback to synthetic data if no real players
-        from app.utils.ml_model import predict_all_players, DEMO_PLAYERS
-        predictions = predict_all_players(DEMO_PLAYERS)
+        from app.utils.ml_model import predict_all_players, get_demo_players
+        predictions = predict_all_players(get_demo_players())
         summary = get_team_risk_summary(predictions)
         return {
             "model_info": {
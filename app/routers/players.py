@@ -2,20 +2,43 @@
 
 from typing import List
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import os
+import shutil
+from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile, status
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, defer
 
 from app.db.database import get_db
 from app.models.models import Player, User, Team
-from app.schemas.schemas import PlayerCreate, PlayerUpdate, PlayerResponse
+from app.schemas.schemas import PlayerCreate, PlayerUpdate, PlayerResponse, from_orm_fast, list_adapter
 from app.utils.auth import get_current_user
+from app.utils.http_cache import list_etag
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/players", tags=["players"])
 
+# Built once at import time; SQLAlchemy caches the compiled SQL keyed on
+# statement identity, so the Selects aren't rebuilt on every request.
+_SEL_PLAYER_BY_OWNER = (
+    select(Player)
+    .join(Team, Player.team_id == Team.id)
+    .where(Player.id == bindparam("pid"), Team.user_id == bindparam("uid"))
+)
+_SEL_OWNED_TEAM = select(Team).where(
+    Team.id == bindparam("tid"), Team.user_id == bindparam("uid")
+)
+# Ownership check for updates: photo_url can hold a multi-MB base64 image,
+# so don't pull it across the wire unless the update actually touches it.
+_SEL_PLAYER_BY_OWNER_NO_PHOTO = _SEL_PLAYER_BY_OWNER.options(defer(Player.photo_url))
+
+# Uploaded photos live under the static mount; only the URL goes in the DB
+PHOTO_UPLOAD_DIR = "app/static/uploads/players"
+_PHOTO_EXTENSIONS = {"image/jpeg": ".jpg", "image/png": ".png", "image/webp": ".webp"}
+
 
 @router.get("", response_model=List[PlayerResponse])
-def get_players(skip: int = 0, limit: int = 100, team_id: int = None, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def get_players(request: Request, skip: int = 0, limit: int = 100, team_id: int = None, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get players with optional team filtering and pagination. Coaches only - only see their own players."""
     print(f"[DEBUG] get_players called by user {current_user.username} (id={current_user.id}) with role='{current_user.role}'")
     if current_user.role == 'admin':
@@ -31,7 +54,7 @@ def get_players(skip: int = 0, limit: int = 100, team_id: int = None, current_us
     
     if team_id:
         # Verify team belongs to current user
-        team = db.query(Team).filter(Team.id == team_id, Team.user_id == current_user.id).first()
+        team = db.execute(_SEL_OWNED_TEAM, {"tid": team_id, "uid": current_user.id}).scalar_one_or_none()
         if not team:
             print(f"[DEBUG] Coach {current_user.username} trying to access team {team_id} they don't own - DENIED")
             raise HTTPException(
@@ -43,19 +66,25 @@ def get_players(skip: int = 0, limit: int = 100, team_id: int = None, current_us
     else:
         print(f"[DEBUG] Coach {current_user.username} accessing all their players (all their teams)")
     
+    # Conditional GET: answer with 304 if the filtered set hasn't changed
+    max_ts, count = query.with_entities(func.max(Player.updated_at), func.count(Player.id)).one()
+    etag = list_etag(max_ts, count, skip, limit)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
     players = query.order_by(Player.id).offset(skip).limit(limit).all()
     print(f"[DEBUG] Returning {len(players)} players for coach {current_user.username}")
-    return players
+    # Serialize through the shared cached TypeAdapter; rows are our own,
+    # already-validated data, so from_orm_fast skips re-validation per row
+    body = list_adapter(PlayerResponse).dump_json([from_orm_fast(PlayerResponse, row) for row in players])
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/{player_id}", response_model=PlayerResponse)
 def get_player(player_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get a specific player by ID (user's player only)."""
     # Join with Team to ensure user owns the team
-    player = db.query(Player).join(Team, Player.team_id == Team.id).filter(
-        Player.id == player_id,
-        Team.user_id == current_user.id
-    ).first()
+    player = db.execute(_SEL_PLAYER_BY_OWNER, {"pid": player_id, "uid": current_user.id}).scalar_one_or_none()
     
     if not player:
         raise HTTPException(
@@ -71,7 +100,7 @@ def create_player(player: PlayerCreate, current_user: User = Depends(get_current
     try:
         # Verify the team belongs to current user
         if player.team_id:
-            team = db.query(Team).filter(Team.id == player.team_id, Team.user_id == current_user.id).first()
+            team = db.execute(_SEL_OWNED_TEAM, {"tid": player.team_id, "uid": current_user.id}).scalar_one_or_none()
             if not team:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
@@ -100,6 +129,13 @@ def create_player(player: PlayerCreate, current_user: User = Depends(get_current
             print(f"[DEBUG] Player {db_player.id} '{db_player.name}' created without photo")
         
         return db_player
+    except IntegrityError:
+        # Unique (team_id, name, surname) key
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A player with this name and surname already exists on this team",
+        )
     except Exception as e:
         logger.error(f"Error creating player: {e}", exc_info=True)
         raise
@@ -109,13 +145,10 @@ def create_player(player: PlayerCreate, current_user: User = Depends(get_current
 def update_player(
     player_id: int, player: PlayerUpdate, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ):
-    """Update an existing player (user's player only) with bulletproof photo persistence."""
-    # Verify ownership
-    db_player = db.query(Player).join(Team, Player.team_id == Team.id).filter(
-        Player.id == player_id,
-        Team.user_id == current_user.id
-    ).first()
-    
+    """Update an existing player (user's player only)."""
+    # Verify ownership without fetching the (potentially huge) photo column
+    db_player = db.execute(_SEL_PLAYER_BY_OWNER_NO_PHOTO, {"pid": player_id, "uid": current_user.id}).scalar_one_or_none()
+
     if not db_player:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -123,48 +156,68 @@ def update_player(
         )
 
     print(f"[DEBUG] Updating player {player_id} '{db_player.name}' for coach {current_user.username}")
-    
-    # BULLETPROOF PHOTO PERSISTENCE IN CLOUD DATABASE
-    existing_photo = db_player.photo_url
-    if existing_photo:
-        print(f"[DEBUG] Existing photo in cloud database: YES ({len(existing_photo)} bytes)")
-    
+
     update_data = player.model_dump(exclude_unset=True)
     print(f"[DEBUG] Update fields received: {list(update_data.keys())}")
-    
-    # CRITICAL: If no photo_url in update, PRESERVE existing photo from cloud database
-    if 'photo_url' not in update_data and existing_photo:
-        print(f"[DEBUG] ✓ PRESERVING photo from cloud database ({len(existing_photo)} bytes)")
-        update_data['photo_url'] = existing_photo
-    elif 'photo_url' in update_data and update_data['photo_url']:
-        print(f"[DEBUG] New photo provided ({len(update_data['photo_url'])} bytes) - will replace in cloud database")
-    
-    # Apply all updates to the player object
+
+    # Only touch photo_url when the update actually includes it; leaving the
+    # attribute alone preserves the stored photo without ever loading it.
     for key, value in update_data.items():
         setattr(db_player, key, value)
-    
-    # FORCE SAVE to cloud database
-    db.add(db_player)
+
+    try:
+        db.commit()
+    except IntegrityError:
+        # Unique (team_id, name, surname) key
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A player with this name and surname already exists on this team",
+        )
+    db.refresh(db_player)
+    return db_player
+
+
+@router.post("/{player_id}/photo", response_model=PlayerResponse)
+def upload_player_photo(
+    player_id: int, photo: UploadFile = File(...), current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+):
+    """Upload a player's photo and store only its URL in the database.
+
+    Keeping the image bytes out of the players row means list responses
+    carry a short URL instead of a multi-MB base64 blob; the file itself
+    is served through the static mount.
+    """
+    db_player = db.execute(_SEL_PLAYER_BY_OWNER_NO_PHOTO, {"pid": player_id, "uid": current_user.id}).scalar_one_or_none()
+
+    if not db_player:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Player not found or you don't have access",
+        )
+
+    ext = _PHOTO_EXTENSIONS.get(photo.content_type)
+    if not ext:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Unsupported image type '{photo.content_type}' (expected JPEG, PNG or WebP)",
+        )
+
+    os.makedirs(PHOTO_UPLOAD_DIR, exist_ok=True)
+    file_path = os.path.join(PHOTO_UPLOAD_DIR, f"{player_id}{ext}")
+    with open(file_path, "wb") as out:
+        shutil.copyfileobj(photo.file, out)
+
+    db_player.photo_url = f"/static/uploads/players/{player_id}{ext}"
     db.commit()
     db.refresh(db_player)
-    
-    # VERIFY photo persisted in cloud database
-    final_photo = db_player.photo_url
-    if final_photo:
-        print(f"✓ VERIFIED: Player {player_id} photo PERSISTED IN CLOUD DATABASE ({len(final_photo)} bytes)")
-    else:
-        print(f"[DEBUG] Player {player_id} has no photo")
-    
     return db_player
 
 
 @router.delete("/{player_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_player(player_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Delete a player (user's player only)."""
-    db_player = db.query(Player).join(Team, Player.team_id == Team.id).filter(
-        Player.id == player_id,
-        Team.user_id == current_user.id
-    ).first()
+    db_player = db.execute(_SEL_PLAYER_BY_OWNER, {"pid": player_id, "uid": current_user.id}).scalar_one_or_none()
     
     if not db_player:
         raise HTTPException(
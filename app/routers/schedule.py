@@ -1,20 +1,23 @@
 """Match Schedule API router for CRUD operations on schedules."""
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
 from app.models.models import MatchSchedule
-from app.schemas.schemas import MatchScheduleCreate, MatchScheduleUpdate, MatchScheduleResponse
+from app.schemas.schemas import MatchScheduleCreate, MatchScheduleUpdate, MatchScheduleResponse, from_orm_fast, list_adapter
+from app.utils.http_cache import list_etag
 
 router = APIRouter(prefix="/schedule", tags=["schedule"])
 
 
 @router.get("", response_model=List[MatchScheduleResponse])
 def get_schedules(
-    skip: int = 0, 
-    limit: int = 100, 
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
     team_id: Optional[int] = Query(None),
     event_type: Optional[str] = Query(None),
     important_only: bool = Query(False),
@@ -22,22 +25,32 @@ def get_schedules(
 ):
     """Get all schedules with optional filters."""
     query = db.query(MatchSchedule)
-    
+
     if team_id:
         query = query.filter(MatchSchedule.team_id == team_id)
     if event_type:
         query = query.filter(MatchSchedule.event_type == event_type)
     if important_only:
         query = query.filter(MatchSchedule.is_important)
-    
+
+    # Conditional GET: answer with 304 if the filtered set hasn't changed
+    max_ts, count = query.with_entities(func.max(MatchSchedule.updated_at), func.count(MatchSchedule.id)).one()
+    etag = list_etag(max_ts, count, skip, limit)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
     schedules = query.order_by(MatchSchedule.event_date).offset(skip).limit(limit).all()
-    return schedules
+    # Serialize through the shared cached TypeAdapter; rows are our own,
+    # already-validated data, so from_orm_fast skips re-validation per row
+    body = list_adapter(MatchScheduleResponse).dump_json([from_orm_fast(MatchScheduleResponse, row) for row in schedules])
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/{schedule_id}", response_model=MatchScheduleResponse)
 def get_schedule(schedule_id: int, db: Session = Depends(get_db)):
     """Get a specific schedule by ID."""
-    schedule = db.query(MatchSchedule).filter(MatchSchedule.id == schedule_id).first()
+    # session.get() consults the identity map before issuing SQL
+    schedule = db.get(MatchSchedule, schedule_id)
     if not schedule:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -61,7 +74,7 @@ def update_schedule(
     schedule_id: int, schedule: MatchScheduleUpdate, db: Session = Depends(get_db)
 ):
     """Update an existing schedule."""
-    db_schedule = db.query(MatchSchedule).filter(MatchSchedule.id == schedule_id).first()
+    db_schedule = db.get(MatchSchedule, schedule_id)
     if not db_schedule:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -80,7 +93,7 @@ def update_schedule(
 @router.delete("/{schedule_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_schedule(schedule_id: int, db: Session = Depends(get_db)):
     """Delete a schedule."""
-    db_schedule = db.query(MatchSchedule).filter(MatchSchedule.id == schedule_id).first()
+    db_schedule = db.get(MatchSchedule, schedule_id)
     if not db_schedule:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -2,11 +2,12 @@
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
 from app.models.models import TrainingSession, Player
-from app.schemas.schemas import SessionCreate, SessionUpdate, SessionResponse
+from app.schemas.schemas import from_orm_fast, SessionCreate, SessionUpdate, SessionResponse
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
@@ -22,14 +23,26 @@ def get_sessions(
     query = db.query(TrainingSession)
     if player_id:
         query = query.filter(TrainingSession.player_id == player_id)
-    sessions = query.offset(skip).limit(limit).all()
-    return sessions
+    rows = query.offset(skip).limit(limit).yield_per(500)
+
+    def iter_sessions():
+        """Stream the JSON array row by row to keep peak memory flat."""
+        yield b"["
+        first = True
+        for row in rows:
+            chunk = from_orm_fast(SessionResponse, row).model_dump_json().encode()
+            yield chunk if first else b"," + chunk
+            first = False
+        yield b"]"
+
+    return StreamingResponse(iter_sessions(), media_type="application/json")
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
 def get_session(session_id: int, db: Session = Depends(get_db)):
     """Get a specific training session by ID."""
-    session = db.query(TrainingSession).filter(TrainingSession.id == session_id).first()
+    # session.get() consults the identity map before issuing SQL
+    session = db.get(TrainingSession, session_id)
     if not session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -41,7 +54,7 @@ def get_session(session_id: int, db: Session = Depends(get_db)):
 @router.post("", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
 def create_session(session: SessionCreate, db: Session = Depends(get_db)):
     """Create a new training session."""
-    player = db.query(Player).filter(Player.id == session.player_id).first()
+    player = db.get(Player, session.player_id)
     if not player:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -60,9 +73,7 @@ def update_session(
     session_id: int, session: SessionUpdate, db: Session = Depends(get_db)
 ):
     """Update an existing training session."""
-    db_session = (
-        db.query(TrainingSession).filter(TrainingSession.id == session_id).first()
-    )
+    db_session = db.get(TrainingSession, session_id)
     if not db_session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -81,9 +92,7 @@ def update_session(
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_session(session_id: int, db: Session = Depends(get_db)):
     """Delete a training session."""
-    db_session = (
-        db.query(TrainingSession).filter(TrainingSession.id == session_id).first()
-    )
+    db_session = db.get(TrainingSession, session_id)
     if not db_session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
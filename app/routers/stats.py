@@ -2,11 +2,12 @@
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
 from app.models.models import SessionStats, TrainingSession
-from app.schemas.schemas import StatsCreate, StatsUpdate, StatsResponse
+from app.schemas.schemas import from_orm_fast, StatsCreate, StatsUpdate, StatsResponse
 
 router = APIRouter(prefix="/stats", tags=["stats"])
 
@@ -22,14 +23,26 @@ def get_all_stats(
     query = db.query(SessionStats)
     if session_id:
         query = query.filter(SessionStats.session_id == session_id)
-    stats = query.offset(skip).limit(limit).all()
-    return stats
+    rows = query.offset(skip).limit(limit).yield_per(500)
+
+    def iter_stats():
+        """Stream the JSON array row by row to keep peak memory flat."""
+        yield b"["
+        first = True
+        for row in rows:
+            chunk = from_orm_fast(StatsResponse, row).model_dump_json().encode()
+            yield chunk if first else b"," + chunk
+            first = False
+        yield b"]"
+
+    return StreamingResponse(iter_stats(), media_type="application/json")
 
 
 @router.get("/{stats_id}", response_model=StatsResponse)
 def get_stats(stats_id: int, db: Session = Depends(get_db)):
     """Get specific session statistics by ID."""
-    stats = db.query(SessionStats).filter(SessionStats.id == stats_id).first()
+    # session.get() consults the identity map before issuing SQL
+    stats = db.get(SessionStats, stats_id)
     if not stats:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -41,9 +54,7 @@ def get_stats(stats_id: int, db: Session = Depends(get_db)):
 @router.post("", response_model=StatsResponse, status_code=status.HTTP_201_CREATED)
 def create_stats(stats: StatsCreate, db: Session = Depends(get_db)):
     """Create new session statistics."""
-    session = (
-        db.query(TrainingSession).filter(TrainingSession.id == stats.session_id).first()
-    )
+    session = db.get(TrainingSession, stats.session_id)
     if not session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -60,7 +71,7 @@ def create_stats(stats: StatsCreate, db: Session = Depends(get_db)):
 @router.put("/{stats_id}", response_model=StatsResponse)
 def update_stats(stats_id: int, stats: StatsUpdate, db: Session = Depends(get_db)):
     """Update existing session statistics."""
-    db_stats = db.query(SessionStats).filter(SessionStats.id == stats_id).first()
+    db_stats = db.get(SessionStats, stats_id)
     if not db_stats:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -79,7 +90,7 @@ def update_stats(stats_id: int, stats: StatsUpdate, db: Session = Depends(get_db
 @router.delete("/{stats_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_stats(stats_id: int, db: Session = Depends(get_db)):
     """Delete session statistics."""
-    db_stats = db.query(SessionStats).filter(SessionStats.id == stats_id).first()
+    db_stats = db.get(SessionStats, stats_id)
     if not db_stats:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,19 +1,27 @@
 """Teams API router for CRUD operations on teams."""
 
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
 from app.models.models import Team, User
-from app.schemas.schemas import TeamCreate, TeamUpdate, TeamResponse
+from app.schemas.schemas import TeamCreate, TeamUpdate, TeamResponse, from_orm_fast, list_adapter
 from app.utils.auth import get_current_user
+from app.utils.http_cache import list_etag
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
+# Built once at import time; SQLAlchemy caches the compiled SQL keyed on
+# statement identity, so the Select isn't rebuilt on every request.
+_SEL_TEAM_BY_OWNER = select(Team).where(
+    Team.id == bindparam("tid"), Team.user_id == bindparam("uid")
+)
+
 
 @router.get("", response_model=List[TeamResponse])
-def get_teams(skip: int = 0, limit: int = 100, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def get_teams(request: Request, skip: int = 0, limit: int = 100, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get teams for the current user only. Coaches only."""
     print(f"[DEBUG] get_teams called by user {current_user.username} with role='{current_user.role}'")
     if current_user.role == 'admin':
@@ -23,14 +31,25 @@ def get_teams(skip: int = 0, limit: int = 100, current_user: User = Depends(get_
             detail="Admins cannot access teams"
         )
     print(f"[DEBUG] Allowing coach {current_user.username} to access teams")
-    teams = db.query(Team).filter(Team.user_id == current_user.id).order_by(Team.id).offset(skip).limit(limit).all()
-    return teams
+    query = db.query(Team).filter(Team.user_id == current_user.id)
+
+    # Conditional GET: answer with 304 if the user's teams haven't changed
+    max_ts, count = query.with_entities(func.max(Team.updated_at), func.count(Team.id)).one()
+    etag = list_etag(max_ts, count, skip, limit)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    teams = query.order_by(Team.id).offset(skip).limit(limit).all()
+    # Serialize through the shared cached TypeAdapter; rows are our own,
+    # already-validated data, so from_orm_fast skips re-validation per row
+    body = list_adapter(TeamResponse).dump_json([from_orm_fast(TeamResponse, row) for row in teams])
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/{team_id}", response_model=TeamResponse)
 def get_team(team_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get a specific team by ID (user's team only)."""
-    team = db.query(Team).filter(Team.id == team_id, Team.user_id == current_user.id).first()
+    team = db.execute(_SEL_TEAM_BY_OWNER, {"tid": team_id, "uid": current_user.id}).scalar_one_or_none()
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -54,7 +73,7 @@ def update_team(
     team_id: int, team: TeamUpdate, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ):
     """Update a team (user's team only)."""
-    db_team = db.query(Team).filter(Team.id == team_id, Team.user_id == current_user.id).first()
+    db_team = db.execute(_SEL_TEAM_BY_OWNER, {"tid": team_id, "uid": current_user.id}).scalar_one_or_none()
     if not db_team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,7 +94,7 @@ def delete_team(team_id: int, current_user: User = Depends(get_current_user), db
     """Delete a team and all related data (user's team only)."""
     from app.models.models import MatchSchedule, Player, TrainingSession, SessionStats
     
-    db_team = db.query(Team).filter(Team.id == team_id, Team.user_id == current_user.id).first()
+    db_team = db.execute(_SEL_TEAM_BY_OWNER, {"tid": team_id, "uid": current_user.id}).scalar_one_or_none()
     if not db_team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -129,7 +148,9 @@ def seed_demo_data_for_user(current_user: User = Depends(get_current_user), db:
     players = seed_demo_players(db, team)
     seed_training_sessions(db, players)
     seed_match_schedule(db, team)
-    
+    # The seed helpers only flush; commit the whole batch at once
+    db.commit()
+
     return {
         "message": "Demo data seeded successfully!",
         "team_id": team.id,
@@ -1,8 +1,15 @@
 """Pydantic schemas for API request/response validation."""
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+
+
+# Shared config for DB-backed response schemas; one ConfigDict instead of
+# re-declaring from_attributes on every response model.
+class _ORMBase(BaseModel):
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
 
 
 # Team schemas
@@ -22,6 +29,7 @@ class TeamCreate(TeamBase):
 
 class TeamUpdate(BaseModel):
     """Schema for updating a team."""
+
     
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     division: Optional[str] = Field(None, max_length=100)
@@ -29,15 +37,13 @@ class TeamUpdate(BaseModel):
     color_secondary: Optional[str] = Field(None, max_length=7)
 
 
-class TeamResponse(TeamBase):
+class TeamResponse(TeamBase, _ORMBase):
     """Schema for team response."""
     
     id: int
     user_id: int
     created_at: datetime
     updated_at: datetime
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
 # Player schemas
@@ -75,7 +81,7 @@ class PlayerUpdate(BaseModel):
     photo_url: Optional[str] = Field(None)
 
 
-class PlayerResponse(PlayerBase):
+class PlayerResponse(PlayerBase, _ORMBase):
     """Schema for player response."""
 
     id: int
@@ -83,8 +89,6 @@ class PlayerResponse(PlayerBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # Training Session schemas
 class SessionBase(BaseModel):
@@ -111,15 +115,13 @@ class SessionUpdate(BaseModel):
     notes: Optional[str] = Field(None, max_length=500)
 
 
-class SessionResponse(SessionBase):
+class SessionResponse(SessionBase, _ORMBase):
     """Schema for training session response."""
 
     id: int
     player_id: int
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # Session Stats schemas
 class StatsBase(BaseModel):
@@ -145,15 +147,13 @@ class StatsUpdate(StatsBase):
     pass
 
 
-class StatsResponse(StatsBase):
+class StatsResponse(StatsBase, _ORMBase):
     """Schema for session statistics response."""
 
     id: int
     session_id: int
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # Health check schemas
 class HealthResponse(BaseModel):
@@ -174,14 +174,12 @@ class UserCreate(UserBase):
     password: str = Field(..., min_length=3)
 
 
-class UserResponse(UserBase):
+class UserResponse(UserBase, _ORMBase):
     id: int
     role: str = "coach"
     is_active: bool = True
     created_at: Optional[datetime]
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class Token(BaseModel):
     access_token: str
@@ -224,18 +222,17 @@ class MatchScheduleUpdate(BaseModel):
     is_important: Optional[bool] = None
 
 
-class MatchScheduleResponse(MatchScheduleBase):
+class MatchScheduleResponse(MatchScheduleBase, _ORMBase):
     """Schema for match schedule response."""
     
     id: int
     created_at: datetime
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
 # Admin schemas
 class AdminUserUpdate(BaseModel):
     """Schema for admin to update user details."""
+
     username: Optional[str] = Field(None, min_length=3, max_length=150)
     email: Optional[str] = Field(None, max_length=254)
     password: Optional[str] = Field(None, min_length=4)
@@ -245,6 +242,7 @@ class AdminUserUpdate(BaseModel):
 
 class TeamAssignment(BaseModel):
     """Schema for assigning/reassigning teams to coaches."""
+
     team_id: int
     user_id: int
 
@@ -256,3 +254,25 @@ class CoachListResponse(BaseModel):
     email: Optional[str]
     role: str
     is_active: bool
+
+
+def from_orm_fast(cls, obj):
+    """Build a response model from a trusted ORM row without validation.
+
+    model_construct skips pydantic-core validation entirely, which is
+    safe for our own DB rows (already validated on the way in) and much
+    faster than model_validate on hot list endpoints. Never use this on
+    user-supplied input.
+    """
+    return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
+
+
+@lru_cache(maxsize=64)
+def list_adapter(cls) -> TypeAdapter:
+    """Shared TypeAdapter for list responses.
+
+    Building a TypeAdapter compiles a pydantic-core schema, which is far
+    too expensive to repeat per request; the cache hands every caller
+    the same pre-built adapter.
+    """
+    return TypeAdapter(list[cls])
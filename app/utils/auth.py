@@ -1,8 +1,14 @@
 """Authentication utilities: password hashing and JWT tokens."""
 
-from datetime import datetime, timedelta
+import hashlib
+import os
+import threading
+import time
+from datetime import timedelta
 from typing import Optional
 
+import argon2
+from cachetools import TTLCache
 from passlib.context import CryptContext
 import jwt
 from fastapi import Depends, HTTPException, status
@@ -12,45 +18,93 @@ from sqlalchemy.orm import Session
 from app.config import settings
 from app.db.database import get_db
 
-# CryptContext with argon2 (no 72-byte limit) and bcrypt fallback
-pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
+# Direct argon2 hasher for the hot path: skips passlib's per-call scheme
+# dispatch and gives us explicit cost parameters (RFC 9106 second
+# recommended option: t=3, 64 MiB, p=4). Parallelism is capped at the
+# worker's actual cores — lanes beyond that just fight each other for
+# CPU. For extra throughput on capable hosts, install a natively built
+# wheel (pip install argon2-cffi --no-binary argon2-cffi) so the
+# compiler can use SSE4/AVX2.
+_ph = argon2.PasswordHasher(
+    time_cost=3,
+    memory_cost=65536,
+    parallelism=min(os.cpu_count() or 2, 4),
+    hash_len=32,
+    salt_len=16,
+)
+
+# passlib kept only so legacy bcrypt hashes still verify
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
+# Signing key/algorithm never change at runtime; read settings once
+_KEY = settings.secret_key
+_ALG = settings.algorithm
+_ALGS = [_ALG]
+
+# Cache of verified token payloads: signature verification costs real CPU on
+# every request and clients reuse the same bearer token for many requests in
+# a row. The short TTL keeps entries well inside any token's lifetime.
+_token_cache = TTLCache(maxsize=10_000, ttl=5)
+_token_cache_lock = threading.Lock()
+
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using argon2 (or bcrypt as fallback)."""
-    return pwd_context.hash(password)
+    """Hash a password using argon2."""
+    return _ph.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against a hash using argon2/bcrypt."""
+    """Verify a password, dispatching by hash prefix (argon2 or legacy bcrypt)."""
+    if hashed_password.startswith("$argon2"):
+        try:
+            return _ph.verify(hashed_password, plain_password)
+        except (argon2.exceptions.VerificationError, argon2.exceptions.InvalidHashError):
+            return False
+    # Legacy bcrypt hashes still verify through passlib
     return pwd_context.verify(plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
-    return encoded_jwt
+    """Issue a signed JWT carrying ``data`` plus an ``exp`` claim.
+
+    ``exp`` is integer epoch seconds (PyJWT accepts this directly), which
+    skips the datetime round-trip and keeps the payload a few bytes
+    shorter. ``data`` itself is never mutated.
+    """
+    expires = expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
+    payload = {**data, "exp": int(time.time() + expires.total_seconds())}
+    return jwt.encode(payload, _KEY, algorithm=_ALG)
+
+
+def decode_access_token(token: str, required: tuple = ("exp", "sub")) -> dict:
+    """Decode and verify a JWT, caching verified payloads for a few seconds.
 
+    Missing claims from ``required`` fail inside jwt.decode with
+    MissingRequiredClaimError (a subclass of InvalidTokenError), so callers
+    don't need a second pass over the payload.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
 
-def decode_access_token(token: str) -> dict:
-    return jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    # Miss (or the cached payload just expired): do the full verification.
+    # Failures raise and are never cached.
+    payload = jwt.decode(token, _KEY, algorithms=_ALGS, options={"require": list(required)})
+    with _token_cache_lock:
+        _token_cache[key] = payload
+    return payload
 
 
 async def get_current_user(credentials = Depends(security), db: Session = Depends(get_db)):
     """Get current user from JWT token."""
     try:
         token = credentials.credentials
+        # decode_access_token enforces the exp/sub claims itself
         payload = decode_access_token(token)
-        username: str = payload.get("sub")
-        if username is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        username: str = payload["sub"]
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,16 @@
+"""HTTP caching helpers for conditional GET support on list endpoints."""
+
+import hashlib
+from typing import Optional
+
+
+def list_etag(max_updated_at, count: int, skip: int = 0, limit: Optional[int] = None) -> str:
+    """Build an ETag for a filtered list from its newest updated_at and row count.
+
+    The dashboard polls list endpoints with identical parameters, so when
+    nothing in the filtered set has changed the ETag stays stable and the
+    client can be answered with a 304 without serializing any rows.
+    """
+    return hashlib.blake2b(
+        f"{max_updated_at}:{count}:{skip}:{limit}".encode(), digest_size=8
+    ).hexdigest()
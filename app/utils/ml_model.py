@@ -7,9 +7,14 @@ This module provides:
 3. Functions to get predictions for individual players
 """
 
-import random
+import functools
+import sys
+from collections import Counter
+from dataclasses import dataclass, fields
 from typing import Dict, List, Optional
 
+import numpy as np
+
 # Simple model weights (simulating a trained logistic regression)
 # In a real scenario, you'd train this on actual historical data
 MODEL_WEIGHTS = {
@@ -21,6 +26,33 @@ MODEL_WEIGHTS = {
     "fatigue_accumulation": 0.05,    # Cumulative fatigue
 }
 
+# Name/position pools, hoisted so they're built once; sys.intern means
+# every generated squad shares the same underlying string objects.
+_POSITIONS = tuple(sys.intern(p) for p in ("Goalkeeper", "Defender", "Midfielder", "Forward"))
+_FIRST_NAMES = tuple(sys.intern(n) for n in (
+    "Marcus", "James", "Carlos", "Mohamed", "Kevin", "Sergio",
+    "David", "Alex", "Bruno", "Luka", "Toni", "Joshua",
+    "Erling", "Kylian", "Vinicius", "Jude", "Phil", "Mason",
+    "Bukayo", "Jamal"))
+_LAST_NAMES = tuple(sys.intern(n) for n in (
+    "Silva", "Rodriguez", "Martinez", "Williams", "Jones",
+    "Garcia", "Johnson", "Brown", "Miller", "Davis",
+    "Fernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin"))
+_POSITIONS_ARR = np.array(_POSITIONS, dtype=object)
+
+# Risk-level classification tables: searchsorted over the sorted bounds
+# gives the level index in one branchless lookup instead of a compare
+# ladder, and the same index picks the recommendation
+_LEVEL_BOUNDS = np.array([30.0, 50.0, 70.0], dtype=np.float32)
+_LEVEL_NAMES = np.array(["low", "moderate", "high", "critical"])
+_RECOMMENDATIONS = np.array([
+    "Continue current training plan - athlete is in good condition",
+    "Monitor closely and consider reducing high-intensity work",
+    "Reduce training intensity by 40% and add extra rest day",
+    "IMMEDIATE REST REQUIRED - High probability of injury within 7 days",
+])
+
 # Thresholds for risk factors
 THRESHOLDS = {
     "weekly_training_minutes_high": 600,    # More than 10 hours/week
@@ -33,231 +65,433 @@ THRESHOLDS = {
 }
 
 
+@dataclass
+class PlayerTable:
+    """
+    Columnar (structure-of-arrays) squad layout.
+
+    One NumPy array per field instead of a list of nested dicts, so the
+    batch scorer reads contiguous memory rather than chasing a dict
+    lookup per field per player. Convert back to dicts only at the JSON
+    boundary via to_dicts().
+    """
+    ids: np.ndarray
+    names: np.ndarray
+    positions: np.ndarray
+    ages: np.ndarray
+    weekly_training_minutes: np.ndarray
+    sessions_this_week: np.ndarray
+    high_intensity_percentage: np.ndarray
+    rest_days_last_week: np.ndarray
+    avg_heart_rate: np.ndarray
+    max_heart_rate_recorded: np.ndarray
+    total_distance_km: np.ndarray
+    sprint_count_weekly: np.ndarray
+    previous_injuries_count: np.ndarray
+    days_since_last_injury: np.ndarray
+    fatigue_score: np.ndarray
+    sleep_quality_avg: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def metric_arrays(self) -> Dict[str, np.ndarray]:
+        """Metric columns keyed like the per-player "metrics" dicts."""
+        skip = {"ids", "names", "positions", "ages"}
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name not in skip}
+
+    def to_dicts(self) -> List[Dict]:
+        """Expand to the list-of-dicts shape used by JSON responses."""
+        metrics = self.metric_arrays()
+        return [
+            {
+                "id": int(self.ids[i]),
+                "name": str(self.names[i]),
+                "position": str(self.positions[i]),
+                "age": int(self.ages[i]),
+                "metrics": {name: col[i].item() for name, col in metrics.items()},
+            }
+            for i in range(len(self))
+        ]
+
+
+def generate_synthetic_players_soa(count: int = 20, seed: int = 0) -> PlayerTable:
+    """
+    Generate a synthetic squad as a PlayerTable.
+
+    Each field is drawn as a whole array in one C call instead of one
+    Python RNG call per player, and the result feeds
+    calculate_injury_risk_batch without any per-player dict walking.
+    """
+    rng = np.random.default_rng(seed)
+
+    # days_since_last_injury: 70% long-recovered (30-500), 30% recent (7-29)
+    long_ago = rng.integers(30, 501, size=count)
+    recent = rng.integers(7, 30, size=count)
+    days_since = np.where(rng.random(count) > 0.3, long_ago, recent)
+
+    # Draw index arrays in one C call each, then map into the interned
+    # module-level pools (tolist() amortizes the element extraction)
+    fi = rng.integers(0, len(_FIRST_NAMES), size=count).tolist()
+    li = rng.integers(0, len(_LAST_NAMES), size=count).tolist()
+    names = np.array([f"{_FIRST_NAMES[a]} {_LAST_NAMES[b]}" for a, b in zip(fi, li)],
+                     dtype=object)
+
+    return PlayerTable(
+        ids=np.arange(1, count + 1, dtype=np.int32),
+        names=names,
+        positions=_POSITIONS_ARR[rng.integers(0, len(_POSITIONS), size=count)],
+        ages=rng.integers(18, 37, size=count, dtype=np.int8),
+        weekly_training_minutes=rng.integers(300, 701, size=count).astype(np.float32),
+        sessions_this_week=rng.integers(3, 8, size=count, dtype=np.int8),
+        high_intensity_percentage=rng.integers(20, 56, size=count).astype(np.float32),
+        rest_days_last_week=rng.integers(0, 4, size=count, dtype=np.int8),
+        avg_heart_rate=rng.integers(140, 176, size=count, dtype=np.int16),
+        max_heart_rate_recorded=rng.integers(170, 201, size=count, dtype=np.int16),
+        total_distance_km=np.round(rng.uniform(25, 70, size=count), 1),
+        sprint_count_weekly=rng.integers(20, 81, size=count).astype(np.float32),
+        previous_injuries_count=rng.integers(0, 5, size=count, dtype=np.int8),
+        days_since_last_injury=days_since.astype(np.float32),
+        fatigue_score=rng.integers(1, 11, size=count, dtype=np.int8),
+        sleep_quality_avg=np.round(rng.uniform(5, 9, size=count), 1),
+    )
+
+
 def generate_synthetic_players(count: int = 20) -> List[Dict]:
     """
     Generate synthetic player data for demonstration purposes.
-    
-    Returns a list of players with realistic training metrics.
+
+    Returns a list of players with realistic training metrics. The
+    drawing itself is fully vectorized (one NumPy call per field via
+    generate_synthetic_players_soa); only the final dict assembly runs
+    per player. Seeded, so repeated calls are reproducible without
+    touching process-global random state.
     """
-    positions = ["Goalkeeper", "Defender", "Midfielder", "Forward"]
-    first_names = ["Marcus", "James", "Carlos", "Mohamed", "Kevin", "Sergio", 
-                   "David", "Alex", "Bruno", "Luka", "Toni", "Joshua",
-                   "Erling", "Kylian", "Vinicius", "Jude", "Phil", "Mason",
-                   "Bukayo", "Jamal"]
-    last_names = ["Silva", "Rodriguez", "Martinez", "Williams", "Jones", 
-                  "Garcia", "Johnson", "Brown", "Miller", "Davis",
-                  "Fernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
-                  "Thomas", "Taylor", "Moore", "Jackson", "Martin"]
-    
-    players = []
-    for i in range(count):
-        # Generate age (18-36 years old)
-        age = random.randint(18, 36)
-        
-        # Generate training load (varies by position and randomly)
-        base_minutes = random.randint(300, 700)
-        
-        # Generate realistic metrics
-        player = {
-            "id": i + 1,
-            "name": f"{random.choice(first_names)} {random.choice(last_names)}",
-            "position": random.choice(positions),
-            "age": age,
-            "metrics": {
-                "weekly_training_minutes": base_minutes,
-                "sessions_this_week": random.randint(3, 7),
-                "high_intensity_percentage": random.randint(20, 55),
-                "rest_days_last_week": random.randint(0, 3),
-                "avg_heart_rate": random.randint(140, 175),
-                "max_heart_rate_recorded": random.randint(170, 200),
-                "total_distance_km": round(random.uniform(25, 70), 1),
-                "sprint_count_weekly": random.randint(20, 80),
-                "previous_injuries_count": random.randint(0, 4),
-                "days_since_last_injury": random.randint(30, 500) if random.random() > 0.3 else random.randint(7, 29),
-                "fatigue_score": random.randint(1, 10),  # 1=fresh, 10=exhausted
-                "sleep_quality_avg": round(random.uniform(5, 9), 1),  # 1-10 scale
-            }
-        }
-        players.append(player)
-    
-    return players
+    return generate_synthetic_players_soa(count).to_dicts()
 
 
-def calculate_injury_risk(player_metrics: Dict, age: int = 25) -> Dict:
+def _score_kernel(weekly_minutes: float, intensity_pct: float, rest_days: float,
+                  age: float, prev_injuries: float, days_since_injury: float,
+                  fatigue: float, sprints: float) -> float:
+    """Scalar scoring kernel over plain floats.
+
+    Thresholds are inlined as literals (keep in sync with THRESHOLDS) so
+    the optional Numba compilation below can fold them into native code.
     """
-    Calculate injury risk score for a player based on their metrics.
-    
-    Uses a weighted scoring system that considers multiple risk factors.
-    Returns a risk score (0-100) and detailed breakdown.
-    
-    Args:
-        player_metrics: Dictionary containing player's training metrics
-        age: Player's age
-        
-    Returns:
-        Dictionary with risk_score, risk_level, and contributing factors
+    total = 0.0
+    if weekly_minutes > 600.0:
+        total += min(25.0, (weekly_minutes - 600.0) / 10.0)
+    if intensity_pct > 40.0:
+        total += min(20.0, (intensity_pct - 40.0) * 0.8)
+    if rest_days < 2.0:
+        total += (2.0 - rest_days) * 10.0
+    if age > 30.0:
+        total += min(15.0, (age - 30.0) * 2.0)
+    if prev_injuries > 0.0:
+        total += min(15.0, prev_injuries * 4.0)
+    if days_since_injury < 30.0:
+        total += max(0.0, (30.0 - days_since_injury) * 0.5)
+    if fatigue > 7.0:
+        total += (fatigue - 7.0) * 5.0
+    if sprints > 50.0:
+        total += min(10.0, (sprints - 50.0) * 0.3)
+    return min(100.0, total)
+
+
+try:
+    # Optional acceleration: compiles the kernel to native code, with the
+    # result cached on disk so only the first call per install pays the
+    # compile. Numba is deliberately not a hard dependency.
+    from numba import njit
+
+    _score_kernel = njit(cache=True, fastmath=True)(_score_kernel)
+except ImportError:
+    pass
+
+
+def _score(player_metrics: Dict, age: int) -> float:
+    """Bare risk score (0-100) with no factor breakdown.
+
+    Thin wrapper extracting kernel inputs (with the model's defaults)
+    from a metrics dict; calculate_injury_risk builds on this for its
+    total.
+    """
+    return _score_kernel(
+        player_metrics.get("weekly_training_minutes", 400),
+        player_metrics.get("high_intensity_percentage", 30),
+        player_metrics.get("rest_days_last_week", 2),
+        age,
+        player_metrics.get("previous_injuries_count", 0),
+        player_metrics.get("days_since_last_injury", 365),
+        player_metrics.get("fatigue_score", 5),
+        player_metrics.get("sprint_count_weekly", 30),
+    )
+
+
+def _risk_factor_breakdown(player_metrics: Dict, age: int = 25) -> List[Dict]:
+    """Textual per-factor breakdown for the drill-down views.
+
+    Contribution arithmetic mirrors _score_kernel factor by factor; the
+    kernel remains the single source of truth for the total.
     """
     risk_factors = []
-    total_risk = 0
-    
+
     # 1. Training Load Risk
     weekly_minutes = player_metrics.get("weekly_training_minutes", 400)
     if weekly_minutes > THRESHOLDS["weekly_training_minutes_high"]:
         load_risk = min(25, (weekly_minutes - THRESHOLDS["weekly_training_minutes_high"]) / 10)
-        total_risk += load_risk
         risk_factors.append({
             "factor": "High Training Load",
             "description": f"Training {weekly_minutes} min/week exceeds safe threshold ({THRESHOLDS['weekly_training_minutes_high']} min)",
             "contribution": round(load_risk, 1),
             "severity": "high" if load_risk > 15 else "medium"
         })
-    
+
     # 2. High Intensity Ratio Risk
     intensity_pct = player_metrics.get("high_intensity_percentage", 30)
     if intensity_pct > THRESHOLDS["high_intensity_percentage"]:
         intensity_risk = min(20, (intensity_pct - THRESHOLDS["high_intensity_percentage"]) * 0.8)
-        total_risk += intensity_risk
         risk_factors.append({
             "factor": "High Intensity Overload",
             "description": f"{intensity_pct}% high-intensity training (recommended: <{THRESHOLDS['high_intensity_percentage']}%)",
             "contribution": round(intensity_risk, 1),
             "severity": "high" if intensity_risk > 12 else "medium"
         })
-    
+
     # 3. Insufficient Rest Risk
     rest_days = player_metrics.get("rest_days_last_week", 2)
     if rest_days < THRESHOLDS["min_rest_days_per_week"]:
         rest_risk = (THRESHOLDS["min_rest_days_per_week"] - rest_days) * 10
-        total_risk += rest_risk
         risk_factors.append({
             "factor": "Insufficient Recovery",
             "description": f"Only {rest_days} rest days last week (minimum: {THRESHOLDS['min_rest_days_per_week']})",
             "contribution": round(rest_risk, 1),
             "severity": "high" if rest_days == 0 else "medium"
         })
-    
+
     # 4. Age Factor Risk
     if age > THRESHOLDS["age_risk_threshold"]:
         age_risk = min(15, (age - THRESHOLDS["age_risk_threshold"]) * 2)
-        total_risk += age_risk
         risk_factors.append({
             "factor": "Age-Related Risk",
             "description": f"Players over {THRESHOLDS['age_risk_threshold']} require more careful load management",
             "contribution": round(age_risk, 1),
             "severity": "medium"
         })
-    
+
     # 5. Previous Injuries Risk
     prev_injuries = player_metrics.get("previous_injuries_count", 0)
     if prev_injuries > 0:
         injury_history_risk = min(15, prev_injuries * 4)
-        total_risk += injury_history_risk
         risk_factors.append({
             "factor": "Injury History",
             "description": f"{prev_injuries} previous injuries on record",
             "contribution": round(injury_history_risk, 1),
             "severity": "high" if prev_injuries >= 3 else "medium"
         })
-    
+
     # 6. Recent Injury Risk
     days_since_injury = player_metrics.get("days_since_last_injury", 365)
     if days_since_injury < 30:
         recent_injury_risk = max(0, (30 - days_since_injury) * 0.5)
-        total_risk += recent_injury_risk
         risk_factors.append({
             "factor": "Recent Injury",
             "description": f"Only {days_since_injury} days since last injury - elevated re-injury risk",
             "contribution": round(recent_injury_risk, 1),
             "severity": "high"
         })
-    
+
     # 7. Fatigue Accumulation Risk
     fatigue = player_metrics.get("fatigue_score", 5)
     if fatigue > 7:
         fatigue_risk = (fatigue - 7) * 5
-        total_risk += fatigue_risk
         risk_factors.append({
             "factor": "Accumulated Fatigue",
             "description": f"High fatigue score ({fatigue}/10) - muscles not fully recovered",
             "contribution": round(fatigue_risk, 1),
             "severity": "high" if fatigue >= 9 else "medium"
         })
-    
+
     # 8. Sprint Overload Risk
     sprints = player_metrics.get("sprint_count_weekly", 30)
     if sprints > THRESHOLDS["sprint_count_high"]:
         sprint_risk = min(10, (sprints - THRESHOLDS["sprint_count_high"]) * 0.3)
-        total_risk += sprint_risk
         risk_factors.append({
             "factor": "Sprint Overload",
             "description": f"{sprints} sprints this week (threshold: {THRESHOLDS['sprint_count_high']})",
             "contribution": round(sprint_risk, 1),
             "severity": "medium"
         })
-    
-    # Cap total risk at 100
-    total_risk = min(100, total_risk)
-    
-    # Determine risk level
-    if total_risk >= 70:
-        risk_level = "critical"
-        recommendation = "IMMEDIATE REST REQUIRED - High probability of injury within 7 days"
-    elif total_risk >= 50:
-        risk_level = "high"
-        recommendation = "Reduce training intensity by 40% and add extra rest day"
-    elif total_risk >= 30:
-        risk_level = "moderate"
-        recommendation = "Monitor closely and consider reducing high-intensity work"
-    else:
-        risk_level = "low"
-        recommendation = "Continue current training plan - athlete is in good condition"
-    
+
+    return risk_factors
+
+
+def calculate_injury_risk(player_metrics: Dict, age: int = 25) -> Dict:
+    """
+    Calculate injury risk score for a player based on their metrics.
+
+    Uses a weighted scoring system that considers multiple risk factors.
+    The total comes from _score (and therefore the compiled
+    _score_kernel); this function adds the textual factor breakdown and
+    classification on top.
+
+    Args:
+        player_metrics: Dictionary containing player's training metrics
+        age: Player's age
+
+    Returns:
+        Dictionary with risk_score, risk_level, and contributing factors
+    """
+    total_risk = _score(player_metrics, age)
+    risk_factors = _risk_factor_breakdown(player_metrics, age)
+
+    # Determine risk level via the shared classification tables
+    level_idx = int(np.searchsorted(_LEVEL_BOUNDS, total_risk, side="right"))
+    risk_level = str(_LEVEL_NAMES[level_idx])
+    recommendation = str(_RECOMMENDATIONS[level_idx])
+
     return {
         "risk_score": round(total_risk, 1),
         "risk_level": risk_level,
         "recommendation": recommendation,
         "risk_factors": risk_factors,
         "metrics_analyzed": {
-            "weekly_training_minutes": weekly_minutes,
-            "high_intensity_percentage": intensity_pct,
-            "rest_days": rest_days,
-            "fatigue_score": fatigue,
-            "sprint_count": sprints,
+            "weekly_training_minutes": player_metrics.get("weekly_training_minutes", 400),
+            "high_intensity_percentage": player_metrics.get("high_intensity_percentage", 30),
+            "rest_days": player_metrics.get("rest_days_last_week", 2),
+            "fatigue_score": player_metrics.get("fatigue_score", 5),
+            "sprint_count": player_metrics.get("sprint_count_weekly", 30),
             "age": age
         }
     }
 
 
+def calculate_injury_risk_batch(metrics, ages: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    Vectorized injury-risk scoring for a whole squad at once.
+
+    Mirrors the arithmetic of calculate_injury_risk but operates on
+    equal-length arrays (one entry per player), so scoring hundreds of
+    players runs in NumPy's C loops instead of the interpreter. The
+    textual factor breakdown is not produced here — use the scalar
+    calculate_injury_risk for single-player drill-down.
+
+    Args:
+        metrics: A PlayerTable, or a mapping of metric name (same keys
+            as the per-player metric dicts) to a NumPy array of values
+        ages: Array of player ages (taken from the table when a
+            PlayerTable is passed)
+
+    Returns:
+        Dictionary with "risk_score" (float array, 0-100), "risk_level"
+        and "recommendation" (string arrays) entries
+    """
+    if isinstance(metrics, PlayerTable):
+        ages = metrics.ages
+        metrics = metrics.metric_arrays()
+
+    f32 = np.float32
+    n = len(ages)
+
+    def col(name, default):
+        values = metrics.get(name)
+        if values is None:
+            return np.full(n, default, dtype=f32)
+        return np.asarray(values, dtype=f32)
+
+    weekly_minutes = col("weekly_training_minutes", 400)
+    intensity_pct = col("high_intensity_percentage", 30)
+    rest_days = col("rest_days_last_week", 2)
+    prev_injuries = col("previous_injuries_count", 0)
+    days_since_injury = col("days_since_last_injury", 365)
+    fatigue = col("fatigue_score", 5)
+    sprints = col("sprint_count_weekly", 30)
+    ages = np.asarray(ages, dtype=f32)
+
+    total = (
+        np.minimum(25, np.maximum(0, weekly_minutes - THRESHOLDS["weekly_training_minutes_high"]) / 10)
+        + np.minimum(20, np.maximum(0, intensity_pct - THRESHOLDS["high_intensity_percentage"]) * 0.8)
+        + np.maximum(0, THRESHOLDS["min_rest_days_per_week"] - rest_days) * 10
+        + np.minimum(15, np.maximum(0, ages - THRESHOLDS["age_risk_threshold"]) * 2)
+        + np.minimum(15, prev_injuries * 4)
+        + np.maximum(0, (30 - days_since_injury) * 0.5)
+        + np.maximum(0, fatigue - 7) * 5
+        + np.minimum(10, np.maximum(0, sprints - THRESHOLDS["sprint_count_high"]) * 0.3)
+    )
+    total = np.clip(total, 0, 100)
+
+    idx = np.searchsorted(_LEVEL_BOUNDS, total, side="right")
+    return {
+        "risk_score": np.round(total, 1),
+        "risk_level": _LEVEL_NAMES[idx],
+        "recommendation": _RECOMMENDATIONS[idx],
+    }
+
+
+# Metric-column defaults used when assembling batch inputs from player
+# dicts (same defaults as _score)
+_METRIC_DEFAULTS = (
+    ("weekly_training_minutes", 400),
+    ("high_intensity_percentage", 30),
+    ("rest_days_last_week", 2),
+    ("previous_injuries_count", 0),
+    ("days_since_last_injury", 365),
+    ("fatigue_score", 5),
+    ("sprint_count_weekly", 30),
+)
+
+
 def predict_all_players(players: Optional[List[Dict]] = None) -> List[Dict]:
     """
     Run injury risk prediction for all players.
-    
+
+    Scores, levels and recommendations come from one vectorized
+    calculate_injury_risk_batch pass over the whole squad; only the
+    textual factor breakdown runs per player.
+
     Args:
         players: List of player dictionaries. If None, generates synthetic data.
-        
+
     Returns:
         List of players with their injury risk predictions
     """
     if players is None:
         players = generate_synthetic_players(20)
-    
+
+    metrics_list = [player.get("metrics", {}) for player in players]
+    ages = np.array([player.get("age", 25) for player in players], dtype=np.float32)
+    columns = {
+        name: np.array([metrics.get(name, default) for metrics in metrics_list], dtype=np.float32)
+        for name, default in _METRIC_DEFAULTS
+    }
+    batch = calculate_injury_risk_batch(columns, ages)
+
     results = []
-    for player in players:
-        prediction = calculate_injury_risk(
-            player_metrics=player.get("metrics", {}),
-            age=player.get("age", 25)
-        )
-        results.append({
+    for i, player in enumerate(players):
+        result = {
             "player_id": player.get("id"),
             "player_name": player.get("name"),
             "position": player.get("position"),
             "age": player.get("age"),
-            **prediction
-        })
-    
+            "risk_score": round(float(batch["risk_score"][i]), 1),
+            "risk_level": str(batch["risk_level"][i]),
+            "recommendation": str(batch["recommendation"][i]),
+        }
+        metrics = metrics_list[i]
+        result["risk_factors"] = _risk_factor_breakdown(metrics, player.get("age", 25))
+        result["metrics_analyzed"] = {
+            "weekly_training_minutes": metrics.get("weekly_training_minutes", 400),
+            "high_intensity_percentage": metrics.get("high_intensity_percentage", 30),
+            "rest_days": metrics.get("rest_days_last_week", 2),
+            "fatigue_score": metrics.get("fatigue_score", 5),
+            "sprint_count": metrics.get("sprint_count_weekly", 30),
+            "age": player.get("age", 25)
+        }
+        results.append(result)
+
     # Sort by risk score (highest first)
     results.sort(key=lambda x: x["risk_score"], reverse=True)
-    
+
     return results
 
 
@@ -274,26 +508,18 @@ def get_team_risk_summary(predictions: List[Dict]) -> Dict:
     if not predictions:
         return {"error": "No predictions available"}
     
-    risk_levels = {"critical": 0, "high": 0, "moderate": 0, "low": 0}
-    total_risk = 0
-    
-    for p in predictions:
-        risk_levels[p["risk_level"]] += 1
-        total_risk += p["risk_score"]
-    
-    avg_risk = total_risk / len(predictions)
-    
-    # Find most common risk factors
-    all_factors = []
-    for p in predictions:
-        for factor in p.get("risk_factors", []):
-            all_factors.append(factor["factor"])
-    
-    factor_counts = {}
-    for f in all_factors:
-        factor_counts[f] = factor_counts.get(f, 0) + 1
-    
-    top_factors = sorted(factor_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    # Counter does the tallying in C; fill in levels nobody hit
+    level_counts = Counter(p["risk_level"] for p in predictions)
+    risk_levels = {level: level_counts.get(level, 0)
+                   for level in ("critical", "high", "moderate", "low")}
+
+    avg_risk = sum(p["risk_score"] for p in predictions) / len(predictions)
+
+    # Most common risk factors across the squad (heap-based top-K, no
+    # intermediate list and no full sort)
+    top_factors = Counter(
+        factor["factor"] for p in predictions for factor in p.get("risk_factors", ())
+    ).most_common(5)
     
     return {
         "total_players": len(predictions),
@@ -306,5 +532,7 @@ def get_team_risk_summary(predictions: List[Dict]) -> Dict:
     }
 
 
-# Pre-generate synthetic players for consistent demo data
-DEMO_PLAYERS = generate_synthetic_players(20)
+@functools.lru_cache(maxsize=1)
+def get_demo_players() -> List[Dict]:
+    """Synthetic demo squad, generated on first use instead of at import."""
+    return generate_synthetic_players(20)
@@ -0,0 +1,53 @@
+"""Shared fixtures for the root-level integration scripts.
+
+Unlike the self-contained suite in tests/, the test_*.py scripts in the
+repository root run against the configured database and a locally
+running dev server. Session scope means one engine, one HTTP connection
+pool and one argon2 hash per fixed credential for the whole run instead
+of per script.
+"""
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.utils.auth import get_password_hash
+
+BASE_URL = "http://localhost:8000"
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """One engine (and connection pool) shared across all scripts."""
+    engine = create_engine(settings.get_database_url())
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def db_session(engine):
+    """A single ORM session bound to the shared engine."""
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def http_client():
+    """Keep-alive client for scripts that hit the running dev server."""
+    with httpx.Client(base_url=BASE_URL, timeout=5.0) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def password_hashes():
+    """Argon2 hashes for the fixed test credentials, computed once.
+
+    Hashing is deliberately slow; scripts should pull from this dict
+    rather than calling get_password_hash themselves.
+    """
+    return {
+        "Demo1234": get_password_hash("Demo1234"),
+        "Coach2234": get_password_hash("Coach2234"),
+    }
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""One-shot migration: move base64 player photos out of the database.
+
+Decodes every base64 photo_url still stored inline in the players table,
+writes it to the static uploads directory, and replaces the column value
+with the short URL served by the static mount. Safe to re-run: rows whose
+photo_url already looks like a URL are skipped.
+"""
+
+import base64
+import os
+
+from app.db.database import SessionLocal
+from app.models.models import Player
+from app.routers.players import PHOTO_UPLOAD_DIR
+
+
+def migrate_photos():
+    db = SessionLocal()
+    migrated = 0
+    skipped = 0
+    try:
+        players = db.query(Player).filter(Player.photo_url.isnot(None)).all()
+        os.makedirs(PHOTO_UPLOAD_DIR, exist_ok=True)
+
+        for player in players:
+            photo = player.photo_url
+            if photo.startswith("/static/") or photo.startswith("http"):
+                skipped += 1
+                continue
+
+            # Strip a data-URI prefix like "data:image/jpeg;base64," if present
+            ext = ".jpg"
+            if photo.startswith("data:"):
+                header, _, photo = photo.partition(",")
+                if "image/png" in header:
+                    ext = ".png"
+                elif "image/webp" in header:
+                    ext = ".webp"
+
+            try:
+                data = base64.b64decode(photo)
+            except (ValueError, TypeError) as e:
+                print(f"[MIGRATE] ✗ Player {player.id}: could not decode photo ({e}), skipping")
+                skipped += 1
+                continue
+
+            file_path = os.path.join(PHOTO_UPLOAD_DIR, f"{player.id}{ext}")
+            with open(file_path, "wb") as out:
+                out.write(data)
+
+            player.photo_url = f"/static/uploads/players/{player.id}{ext}"
+            migrated += 1
+            print(f"[MIGRATE] ✓ Player {player.id}: {len(data)} bytes -> {player.photo_url}")
+
+        db.commit()
+        print(f"[MIGRATE] Done: {migrated} migrated, {skipped} skipped")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate_photos()
@@ -1,63 +1,61 @@
 #!/usr/bin/env python3
 """Test script to verify admin can see coaches list."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session
+import sys
+
+import pytest
+from sqlalchemy import func
+
 from app.models.models import User
-from app.config import settings
 
-def test_coaches():
+# Per-user listing is noisy on big tables; opt in with -v
+VERBOSE = "-v" in sys.argv
+
+
+def test_coaches(db_session):
     """Check if coaches exist and can be retrieved."""
-    try:
-        # Get database URL
-        db_url = settings.database_url
-        print(f"[TEST] Database: {db_url}")
-        
-        # Create engine and connect
-        engine = create_engine(db_url)
-        
-        with Session(engine) as db:
-            # Get all users
-            all_users = db.query(User).all()
-            print(f"\n[TEST] Total users in database: {len(all_users)}\n")
-            print("[TEST] All Users:")
-            print("-" * 80)
-            for user in all_users:
-                print(f"  ID: {user.id:2d} | Username: {user.username:20s} | Role: {user.role:10s} | Email: {user.email}")
-            print("-" * 80)
-            
-            # Count by role
-            admins = db.query(User).filter(User.role == "admin").all()
-            coaches = db.query(User).filter(User.role == "coach").all()
-            nulls = db.query(User).filter(User.role is None).all()
-            others = db.query(User).filter(~User.role.in_(["admin", "coach"])).all()
-            
-            print("\n[TEST] SUMMARY:")
-            print(f"  - Admins (role='admin'):   {len(admins)}")
-            print(f"  - Coaches (role='coach'):  {len(coaches)}")
-            print(f"  - NULL roles:              {len(nulls)}")
-            print(f"  - Other roles:             {len(others)}")
-            
-            if len(coaches) == 0:
-                print("\n⚠️  WARNING: NO COACHES FOUND!")
-                print("[TEST] Coaches with NULL or other roles:")
-                non_admin = db.query(User).filter(User.role != "admin").all()
-                for user in non_admin:
-                    print(f"  - {user.username}: role='{user.role}'")
-            
-            print("\n[TEST] Expected Admin Query (/admin/coaches):")
-            print("  Query: User.role == 'coach'")
-            print(f"  Result: {len(coaches)} coaches")
-            
-            if coaches:
-                print("\n[TEST] Coaches that would be returned:")
-                for coach in coaches:
-                    print(f"  - {coach.username} (ID={coach.id})")
-    
-    except Exception as e:
-        print(f"[ERROR] {e}")
-        import traceback
-        traceback.print_exc()
+    db = db_session
+
+    # One aggregate query instead of a full-table fetch per role
+    counts = dict(db.query(User.role, func.count()).group_by(User.role).all())
+    total_users = sum(counts.values())
+    admins_count = counts.get("admin", 0)
+    coaches_count = counts.get("coach", 0)
+    nulls_count = counts.get(None, 0)
+    others_count = sum(
+        c for role, c in counts.items() if role not in ("admin", "coach", None)
+    )
+
+    print(f"\n[TEST] Total users in database: {total_users}\n")
+    if VERBOSE:
+        print("[TEST] All Users:")
+        print("-" * 80)
+        for user in db.query(User).all():
+            print(f"  ID: {user.id:2d} | Username: {user.username:20s} | Role: {user.role:10s} | Email: {user.email}")
+        print("-" * 80)
+
+    print("\n[TEST] SUMMARY:")
+    print(f"  - Admins (role='admin'):   {admins_count}")
+    print(f"  - Coaches (role='coach'):  {coaches_count}")
+    print(f"  - NULL roles:              {nulls_count}")
+    print(f"  - Other roles:             {others_count}")
+
+    if coaches_count == 0:
+        print("\n⚠️  WARNING: NO COACHES FOUND!")
+        print("[TEST] Coaches with NULL or other roles:")
+        non_admin = db.query(User).filter(User.role != "admin").all()
+        for user in non_admin:
+            print(f"  - {user.username}: role='{user.role}'")
+
+    print("\n[TEST] Expected Admin Query (/admin/coaches):")
+    print("  Query: User.role == 'coach'")
+    print(f"  Result: {coaches_count} coaches")
+
+    if coaches_count:
+        print("\n[TEST] Coaches that would be returned:")
+        for coach in db.query(User).filter(User.role == "coach").all():
+            print(f"  - {coach.username} (ID={coach.id})")
+
 
 if __name__ == "__main__":
-    test_coaches()
+    pytest.main([__file__, "-s"] + sys.argv[1:])
@@ -1,13 +1,17 @@
 """Tests for the Football Performance Dashboard API."""
 
+import argon2
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.db.database import Base, get_db
+from app.models.models import User
+from app.routers import players
+from app.utils import auth
 
 
 # Create test database
@@ -20,56 +24,161 @@ engine = create_engine(
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-def override_get_db():
-    """Override database dependency for testing."""
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+@event.listens_for(engine, "connect")
+def _set_test_pragmas(dbapi_connection, connection_record):
+    # pysqlite never opens a real transaction on its own, which silently
+    # turns the external transaction in db_session into a no-op; disable
+    # its implicit handling and emit BEGIN ourselves (see the "begin"
+    # listener below).
+    dbapi_connection.isolation_level = None
+    # Throwaway database: keep the journal in memory and skip syncs
+    # entirely, the most aggressive settings SQLite offers. Test-engine
+    # only — the app engine keeps its durable WAL pragmas.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
 
 
-app.dependency_overrides[get_db] = override_get_db
+@event.listens_for(engine, "begin")
+def _begin_transaction(conn):
+    conn.exec_driver_sql("BEGIN")
 
 
-@pytest.fixture(scope="function")
-def client():
-    """Create a test client with a fresh database for each test."""
+# The session currently owned by the running test; request handlers get
+# it through the dependency override below
+_db_session = None
+
+
+def override_get_db():
+    """Override database dependency for testing."""
+    yield _db_session
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _fast_password_hashing():
+    """Hash passwords at minimum argon2 cost for the test run.
+
+    The production parameters are deliberately expensive; tests only
+    need hashes that round-trip, so swap in the cheapest settings the
+    library accepts and restore the real hasher afterwards. Kept local
+    to this suite — the root-level scripts seed real databases and must
+    keep production-strength hashes.
+    """
+    production_hasher = auth._ph
+    auth._ph = argon2.PasswordHasher(
+        time_cost=1, memory_cost=8, parallelism=1, hash_len=16, salt_len=8
+    )
+    yield
+    auth._ph = production_hasher
+
+
+@pytest.fixture(scope="session")
+def _schema():
+    """Create the schema once for the whole run.
+
+    Tests are isolated by the rollback in db_session, not by per-test
+    create_all/drop_all DDL.
+    """
     Base.metadata.create_all(bind=engine)
+    yield
+    # :memory: + StaticPool means the whole database lives on the pool's
+    # single connection; disposing it discards everything in one step
+    # instead of a DROP TABLE per table
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def db_session(_schema):
+    """Yield a session joined into an external transaction.
+
+    Everything a test writes goes into SAVEPOINTs on one connection;
+    rolling back the outer transaction on teardown restores a clean
+    database without any DDL.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    # create_savepoint turns every handler commit into a SAVEPOINT
+    # release nested inside the external transaction
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def _client(_schema):
+    """One TestClient for the whole run.
+
+    Entering the client runs app lifespan startup/shutdown; doing that
+    once instead of per test is safe because isolation comes from the
+    per-test rollback, not from rebuilding the app.
+    """
+    app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as test_client:
         yield test_client
-    Base.metadata.drop_all(bind=engine)
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(scope="function")
+def client(_client, db_session):
+    """Bind the current test's session to the shared client."""
+    global _db_session
+    _db_session = db_session
+    yield _client
+    _db_session = None
+
+
+def _issue_coach_token(username, email):
+    """Create a coach row and mint its token without going over HTTP.
+
+    The user is committed directly on the engine, outside any test
+    transaction, so it persists for the whole run (test rollbacks
+    restore to committed state). The token comes from the app's own
+    create_access_token, skipping the register/login round trips — the
+    auth endpoints keep their own coverage in TestAuthEndpoint.
+    """
+    session = TestingSessionLocal()
+    try:
+        session.add(User(
+            username=username,
+            email=email,
+            password_hash=auth.get_password_hash("SecurePassword123"),
+            role="coach",
+            is_active=1,
+        ))
+        session.commit()
+        return auth.create_access_token(data={"sub": username})
+    finally:
+        session.close()
 
 
+@pytest.mark.xdist_group("players")
 class TestHealthEndpoint:
     """Tests for the health check endpoint."""
 
+    @pytest.fixture(scope="class")
+    def coach_token(self, _schema):
+        """Auth token for the class coach, issued once per class."""
+        return _issue_coach_token("testcoach", "coach@example.com")
+
+    @pytest.fixture(scope="class")
+    def auth_headers(self, coach_token):
+        """Authorization header dict, built once per class."""
+        return {"Authorization": f"Bearer {coach_token}"}
+
     @staticmethod
-    def get_coach_token(client):
-        """Helper to create a coach and return auth token."""
-        # Try to register - if user exists, just login
-        user_data = {
-            "username": "testcoach",
-            "email": "coach@example.com",
-            "password": "SecurePassword123",
-        }
-        client.post("/auth/register", json=user_data)
-        
-        login_data = {
-            "username": "testcoach",
-            "password": "SecurePassword123",
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        return login_response.json()["access_token"]
-    
-    @staticmethod
-    def create_team(client, token):
+    def create_team(client, auth_headers):
         """Helper to create a team."""
         team_data = {
             "name": "Test Team",
             "division": "Division 1"
         }
-        response = client.post("/teams", json=team_data, headers={"Authorization": f"Bearer {token}"})
+        response = client.post("/teams", json=team_data, headers=auth_headers)
         return response.json()["id"]
 
     def test_health_check(self, client):
@@ -102,10 +211,9 @@ class TestHealthEndpoint:
         assert response.status_code == 200
         assert response.json() == []
 
-    def test_create_player(self, client):
+    def test_create_player(self, client, auth_headers):
         """Test creating a new player."""
-        token = self.get_coach_token(client)
-        team_id = self.create_team(client, token)
+        team_id = self.create_team(client, auth_headers)
         
         player_data = {
             "name": "John Doe",
@@ -113,91 +221,121 @@ class TestHealthEndpoint:
             "birth_date": "2000-12-03",
             "team_id": team_id,
         }
-        response = client.post("/players", json=player_data, headers={"Authorization": f"Bearer {token}"})
+        response = client.post("/players", json=player_data, headers=auth_headers)
         assert response.status_code == 201
         data = response.json()
         assert data["name"] == "John Doe"
         assert data["position"] == "Forward"
         assert "id" in data
 
-    def test_get_player(self, client):
+    def test_get_player(self, client, auth_headers):
         """Test getting a specific player."""
-        token = self.get_coach_token(client)
-        team_id = self.create_team(client, token)
+        team_id = self.create_team(client, auth_headers)
         
         player_data = {"name": "Jane Smith", "position": "Midfielder", "team_id": team_id}
-        create_response = client.post("/players", json=player_data, headers={"Authorization": f"Bearer {token}"})
+        create_response = client.post("/players", json=player_data, headers=auth_headers)
         player_id = create_response.json()["id"]
 
-        response = client.get(f"/players/{player_id}", headers={"Authorization": f"Bearer {token}"})
+        response = client.get(f"/players/{player_id}", headers=auth_headers)
         assert response.status_code == 200
         assert response.json()["name"] == "Jane Smith"
 
-    def test_get_player_not_found(self, client):
+    def test_get_player_not_found(self, client, auth_headers):
         """Test getting a non-existent player."""
-        token = self.get_coach_token(client)
-        response = client.get("/players/9999", headers={"Authorization": f"Bearer {token}"})
+        response = client.get("/players/9999", headers=auth_headers)
         assert response.status_code == 404
 
-    def test_update_player(self, client):
+    def test_update_player(self, client, auth_headers):
         """Test updating a player."""
-        token = self.get_coach_token(client)
-        team_id = self.create_team(client, token)
+        team_id = self.create_team(client, auth_headers)
         
         player_data = {"name": "Original Name", "position": "Defender", "team_id": team_id}
-        create_response = client.post("/players", json=player_data, headers={"Authorization": f"Bearer {token}"})
+        create_response = client.post("/players", json=player_data, headers=auth_headers)
         player_id = create_response.json()["id"]
 
         update_data = {"name": "Updated Name"}
-        response = client.put(f"/players/{player_id}", json=update_data, headers={"Authorization": f"Bearer {token}"})
+        response = client.put(f"/players/{player_id}", json=update_data, headers=auth_headers)
         assert response.status_code == 200
         assert response.json()["name"] == "Updated Name"
         assert response.json()["position"] == "Defender"
 
-    def test_delete_player(self, client):
+    def test_duplicate_player_conflict(self, client, auth_headers):
+        """Test duplicate name+surname on one team returns 409."""
+        team_id = self.create_team(client, auth_headers)
+
+        player_data = {"name": "John", "surname": "Doe", "position": "Forward", "team_id": team_id}
+        first = client.post("/players", json=player_data, headers=auth_headers)
+        assert first.status_code == 201
+
+        response = client.post("/players", json=player_data, headers=auth_headers)
+        assert response.status_code == 409
+        assert "already exists" in response.json()["detail"]
+
+        # Renaming another player into the collision is rejected too
+        other = client.post(
+            "/players",
+            json={"name": "Jane", "surname": "Doe", "position": "Forward", "team_id": team_id},
+            headers=auth_headers,
+        )
+        other_id = other.json()["id"]
+        response = client.put(f"/players/{other_id}", json={"name": "John"}, headers=auth_headers)
+        assert response.status_code == 409
+
+    def test_upload_player_photo(self, client, auth_headers, monkeypatch, tmp_path):
+        """Test uploading a photo stores a URL instead of image bytes."""
+        # Keep the uploaded file out of the real static tree
+        monkeypatch.setattr(players, "PHOTO_UPLOAD_DIR", str(tmp_path))
+        team_id = self.create_team(client, auth_headers)
+
+        player_data = {"name": "Photo Player", "position": "Forward", "team_id": team_id}
+        create_response = client.post("/players", json=player_data, headers=auth_headers)
+        player_id = create_response.json()["id"]
+
+        response = client.post(
+            f"/players/{player_id}/photo",
+            files={"photo": ("photo.png", b"\x89PNG\r\n\x1a\nfakeimagebytes", "image/png")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["photo_url"] == f"/static/uploads/players/{player_id}.png"
+
+    def test_delete_player(self, client, auth_headers):
         """Test deleting a player."""
-        token = self.get_coach_token(client)
-        team_id = self.create_team(client, token)
+        team_id = self.create_team(client, auth_headers)
         
         player_data = {"name": "To Delete", "position": "Goalkeeper", "team_id": team_id}
-        create_response = client.post("/players", json=player_data, headers={"Authorization": f"Bearer {token}"})
+        create_response = client.post("/players", json=player_data, headers=auth_headers)
         player_id = create_response.json()["id"]
 
-        response = client.delete(f"/players/{player_id}", headers={"Authorization": f"Bearer {token}"})
+        response = client.delete(f"/players/{player_id}", headers=auth_headers)
         assert response.status_code == 204
 
-        get_response = client.get(f"/players/{player_id}", headers={"Authorization": f"Bearer {token}"})
+        get_response = client.get(f"/players/{player_id}", headers=auth_headers)
         assert get_response.status_code == 404
 
 
+@pytest.mark.xdist_group("sessions")
 class TestSessionsEndpoint:
     """Tests for the sessions API endpoints."""
 
+    @pytest.fixture(scope="class")
+    def coach_token(self, _schema):
+        """Auth token for the class coach, issued once per class."""
+        return _issue_coach_token("testcoach2", "coach2@example.com")
+
+    @pytest.fixture(scope="class")
+    def auth_headers(self, coach_token):
+        """Authorization header dict, built once per class."""
+        return {"Authorization": f"Bearer {coach_token}"}
+
     @staticmethod
-    def get_coach_token(client):
-        """Helper to create a coach and return auth token."""
-        user_data = {
-            "username": "testcoach2",
-            "email": "coach2@example.com",
-            "password": "SecurePassword123",
-        }
-        client.post("/auth/register", json=user_data)
-        
-        login_data = {
-            "username": "testcoach2",
-            "password": "SecurePassword123",
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        return login_response.json()["access_token"]
-    
-    @staticmethod
-    def create_team(client, token):
+    def create_team(client, auth_headers):
         """Helper to create a team."""
         team_data = {
             "name": "Sessions Test Team",
             "division": "Division 1"
         }
-        response = client.post("/teams", json=team_data, headers={"Authorization": f"Bearer {token}"})
+        response = client.post("/teams", json=team_data, headers=auth_headers)
         return response.json()["id"]
 
     def test_get_sessions_empty(self, client):
@@ -206,13 +344,12 @@ class TestSessionsEndpoint:
         assert response.status_code == 200
         assert response.json() == []
 
-    def test_create_session(self, client):
+    def test_create_session(self, client, auth_headers):
         """Test creating a training session."""
-        token = self.get_coach_token(client)
-        team_id = self.create_team(client, token)
+        team_id = self.create_team(client, auth_headers)
         
         player_data = {"name": "Test Player", "position": "Forward", "team_id": team_id}
-        player_response = client.post("/players", json=player_data, headers={"Authorization": f"Bearer {token}"})
+        player_response = client.post("/players", json=player_data, headers=auth_headers)
         player_id = player_response.json()["id"]
 
         session_data = {
@@ -222,7 +359,7 @@ class TestSessionsEndpoint:
             "session_type": "Training",
             "notes": "Practice session",
         }
-        response = client.post("/sessions", json=session_data, headers={"Authorization": f"Bearer {token}"})
+        response = client.post("/sessions", json=session_data, headers=auth_headers)
         assert response.status_code == 201
         data = response.json()
         assert data["duration_minutes"] == 90
@@ -240,34 +377,28 @@ class TestSessionsEndpoint:
         assert response.status_code == 404
 
 
+@pytest.mark.xdist_group("stats")
 class TestStatsEndpoint:
     """Tests for the stats API endpoints."""
 
+    @pytest.fixture(scope="class")
+    def coach_token(self, _schema):
+        """Auth token for the class coach, issued once per class."""
+        return _issue_coach_token("testcoach3", "coach3@example.com")
+
+    @pytest.fixture(scope="class")
+    def auth_headers(self, coach_token):
+        """Authorization header dict, built once per class."""
+        return {"Authorization": f"Bearer {coach_token}"}
+
     @staticmethod
-    def get_coach_token(client):
-        """Helper to create a coach and return auth token."""
-        user_data = {
-            "username": "testcoach3",
-            "email": "coach3@example.com",
-            "password": "SecurePassword123",
-        }
-        client.post("/auth/register", json=user_data)
-        
-        login_data = {
-            "username": "testcoach3",
-            "password": "SecurePassword123",
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        return login_response.json()["access_token"]
-    
-    @staticmethod
-    def create_team(client, token):
+    def create_team(client, auth_headers):
         """Helper to create a team."""
         team_data = {
             "name": "Stats Test Team",
             "division": "Division 1"
         }
-        response = client.post("/teams", json=team_data, headers={"Authorization": f"Bearer {token}"})
+        response = client.post("/teams", json=team_data, headers=auth_headers)
         return response.json()["id"]
 
     def test_get_stats_empty(self, client):
@@ -276,13 +407,12 @@ class TestStatsEndpoint:
         assert response.status_code == 200
         assert response.json() == []
 
-    def test_create_stats(self, client):
+    def test_create_stats(self, client, auth_headers):
         """Test creating session statistics."""
-        token = self.get_coach_token(client)
-        team_id = self.create_team(client, token)
+        team_id = self.create_team(client, auth_headers)
         
         player_response = client.post(
-            "/players", json={"name": "Test Player", "position": "Forward", "team_id": team_id}, headers={"Authorization": f"Bearer {token}"}
+            "/players", json={"name": "Test Player", "position": "Forward", "team_id": team_id}, headers=auth_headers
         )
         player_id = player_response.json()["id"]
 
@@ -294,7 +424,7 @@ class TestStatsEndpoint:
                 "duration_minutes": 90,
                 "session_type": "Training",
             },
-            headers={"Authorization": f"Bearer {token}"}
+            headers=auth_headers
         )
         session_id = session_response.json()["id"]
 
@@ -307,7 +437,7 @@ class TestStatsEndpoint:
             "calories_burned": 650,
             "sprints_count": 15,
         }
-        response = client.post("/stats", json=stats_data, headers={"Authorization": f"Bearer {token}"})
+        response = client.post("/stats", json=stats_data, headers=auth_headers)
         assert response.status_code == 201
         data = response.json()
         assert data["distance_km"] == 8.5
@@ -323,6 +453,7 @@ class TestStatsEndpoint:
         assert response.status_code == 404
 
 
+@pytest.mark.xdist_group("auth")
 class TestAuthEndpoint:
     """Tests for the authentication endpoints."""
 
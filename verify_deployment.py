@@ -1,15 +1,24 @@
 import sys
 import os
-import importlib
+import importlib.util
 
 def check_import(module_name):
-    try:
-        importlib.import_module(module_name)
-        print(f"✅ Import successful: {module_name}")
+    # find_spec only walks the finder chain; the module's top-level code
+    # (SQLAlchemy registries, the Azure SDK, ...) never runs
+    if module_name in sys.modules:
+        print(f"✅ Import successful: {module_name} (already loaded)")
         return True
+    try:
+        found = importlib.util.find_spec(module_name) is not None
     except ImportError as e:
+        # A missing parent package surfaces as ModuleNotFoundError
         print(f"❌ Import failed: {module_name} - {e}")
         return False
+    if found:
+        print(f"✅ Import successful: {module_name}")
+        return True
+    print(f"❌ Import failed: {module_name} - not found")
+    return False
 
 def check_env_vars():
     # These are expected in Azure
@@ -29,7 +38,9 @@ def main():
     # 1. Check Dependencies
     print("\n1️⃣  Checking Critical Dependencies:")
     deps = ["fastapi", "sqlalchemy", "pydantic", "pyodbc", "opencensus.ext.azure"]
-    all_deps_ok = all(check_import(dep) for dep in deps)
+    # List, not generator: report every dependency instead of stopping
+    # at the first failure
+    all_deps_ok = all([check_import(dep) for dep in deps])
     
     if not all_deps_ok:
         print("\n❌ Critical dependencies missing. Deployment will likely fail.")